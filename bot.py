@@ -1,5 +1,6 @@
 import os
-import json
+import uuid
+from pathlib import Path
 from loguru import logger
 from dotenv import load_dotenv
 
@@ -16,8 +17,17 @@ from pipecat.transports.services.daily import DailyParams, DailyTransport
 from pipecatcloud.agent import DailySessionArguments
 from pipecat_flows import FlowManager
 
+from config.settings import load_content_reload_interval
+from utils.content_store import ContentSnapshot, ContentStore
+
 load_dotenv(override=True)
 
+# Shared across sessions in this worker; edits to prompts/ or flows/ are picked
+# up by the watcher and served to new sessions without a restart.
+_BASE_DIR = Path(__file__).parent
+content_store = ContentStore(_BASE_DIR / "prompts", _BASE_DIR / "flows")
+CONTENT_RELOAD_INTERVAL = load_content_reload_interval()
+
 async def set_profile(args):
     """Handle user profile collection (name and target language)."""
     logger.info(f"Setting profile: {args}")
@@ -26,13 +36,11 @@ async def set_profile(args):
     logger.info(f"Profile set - Name: {name}, Language: {target_language}")
     return {"name": name, "target_language": target_language}, "end"
 
-async def main(transport: DailyTransport):
-    # Load ConvoLingo Flow Configuration
+async def main(transport: DailyTransport, content: ContentSnapshot):
+    # Load ConvoLingo Flow Configuration from this session's pinned snapshot
     try:
-        flow_config_path = os.path.join(os.path.dirname(__file__), "flows", "convolingo_hello_world.json")
-        with open(flow_config_path, "r") as f:
-            flow_config = json.load(f)
-        logger.info("Loaded ConvoLingo flow configuration")
+        flow_config = content.flow("convolingo_hello_world")
+        logger.info(f"Loaded ConvoLingo flow configuration (content {content.version})")
     except Exception as e:
         logger.error(f"Failed to load flow config: {e}")
         flow_config = None
@@ -116,21 +124,32 @@ async def bot(args: DailySessionArguments):
     """Main bot entry point compatible with Pipecat Cloud."""
     logger.info(f"ConvoLingo bot process initialized {args.room_url} {args.token is not None}")
 
-    transport = DailyTransport(
-        args.room_url,
-        args.token,
-        "ConvoLingo WebApp",
-        DailyParams(
-            audio_in_enabled=True,
-            audio_out_enabled=True,
-            transcription_enabled=True,
-            vad_analyzer=SileroVADAnalyzer(),
-        ),
+    content_store.start_watching(CONTENT_RELOAD_INTERVAL)
+    # Rooms are shared in dev, so key the session on a fresh id rather than the URL
+    session_id = uuid.uuid4().hex
+    content = content_store.acquire(session_id)
+    logger.info(
+        f"Session {session_id} ({args.room_url}) using content {content.version} "
+        f"(loaded in {content.reload_seconds * 1000:.1f} ms); "
+        f"active sessions: {content_store.session_versions()}"
     )
 
     try:
-        await main(transport)
+        transport = DailyTransport(
+            args.room_url,
+            args.token,
+            "ConvoLingo WebApp",
+            DailyParams(
+                audio_in_enabled=True,
+                audio_out_enabled=True,
+                transcription_enabled=True,
+                vad_analyzer=SileroVADAnalyzer(),
+            ),
+        )
+        await main(transport, content)
         logger.info("ConvoLingo bot process completed")
     except Exception as e:
         logger.exception(f"Error in ConvoLingo bot process: {str(e)}")
-        raise
\ No newline at end of file
+        raise
+    finally:
+        content_store.release(session_id)
@@ -4,8 +4,12 @@ import os
 from dataclasses import dataclass
 from typing import List
 
+from loguru import logger
 from pipecat.utils.text.markdown_text_filter import MarkdownTextFilter
 
+DEFAULT_CONTENT_RELOAD_INTERVAL = 2.0
+MIN_CONTENT_RELOAD_INTERVAL = 0.5
+
 
 @dataclass
 class AppConfig:
@@ -13,6 +17,27 @@ class AppConfig:
     cartesia_api_key: str | None
     voice_id: str
     text_filters: List[object]
+    content_reload_interval: float
+
+
+def load_content_reload_interval() -> float:
+    """Seconds between checks for edits under prompts/ and flows/.
+
+    Read from CONTENT_RELOAD_INTERVAL; invalid values fall back to the
+    default and anything below MIN_CONTENT_RELOAD_INTERVAL is clamped.
+    """
+    raw = os.getenv("CONTENT_RELOAD_INTERVAL")
+    if not raw:
+        return DEFAULT_CONTENT_RELOAD_INTERVAL
+    try:
+        interval = float(raw)
+    except ValueError:
+        logger.warning(f"Invalid CONTENT_RELOAD_INTERVAL={raw!r}; using {DEFAULT_CONTENT_RELOAD_INTERVAL}")
+        return DEFAULT_CONTENT_RELOAD_INTERVAL
+    if not interval >= MIN_CONTENT_RELOAD_INTERVAL:
+        logger.warning(f"CONTENT_RELOAD_INTERVAL={raw!r} too small; using {MIN_CONTENT_RELOAD_INTERVAL}")
+        return MIN_CONTENT_RELOAD_INTERVAL
+    return interval
 
 
 def load_config() -> AppConfig:
@@ -22,6 +47,7 @@ def load_config() -> AppConfig:
     - CARTESIA_API_KEY for STT/TTS
     - CARTESIA_VOICE_ID optional; defaults to a known voice
     - text_filters preconfigured with MarkdownTextFilter
+    - CONTENT_RELOAD_INTERVAL optional; see load_content_reload_interval
     """
     google_key = os.getenv("GOOGLE_API_KEY") or os.getenv("GEMINI_API_KEY")
     cartesia_key = os.getenv("CARTESIA_API_KEY")
@@ -32,6 +58,7 @@ def load_config() -> AppConfig:
         cartesia_api_key=cartesia_key,
         voice_id=voice_id,
         text_filters=text_filters,
+        content_reload_interval=load_content_reload_interval(),
     )
 
 
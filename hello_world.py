@@ -10,6 +10,8 @@ Requirements:
 
 import argparse
 import os
+import uuid
+from pathlib import Path
 
 from loguru import logger
 from pipecat.pipeline.pipeline import Pipeline
@@ -25,33 +27,27 @@ from pipecat.utils.text.markdown_text_filter import MarkdownTextFilter
 from pipecat_flows import FlowArgs, FlowManager, FlowsFunctionSchema, NodeConfig
 from functions.favorite_color import get_record_favorite_color_func
 
-from config.settings import load_config
+from config.settings import AppConfig, load_config
 
 from config.transport import transport_params
+from utils.content_store import ContentSnapshot, ContentStore
 
+content_store = ContentStore(Path(__file__).parent / "prompts", Path(__file__).parent / "flows")
 
-def create_initial_node() -> NodeConfig:
-    """Initial node: greet and ask favorite color (per README)."""
-    record_favorite_color_func = get_record_favorite_color_func()
-
-    # Load task messages from prompts/en/v1/initial.json
-    import json
-    from pathlib import Path
 
-    prompts_path = Path(__file__).parent / "prompts" / "en" / "v1" / "initial.json"
-    with prompts_path.open("r", encoding="utf-8") as fp:
-        initial_task_messages = json.load(fp)
+def create_initial_node(content: ContentSnapshot) -> NodeConfig:
+    """Initial node: greet and ask favorite color (per README).
 
-    # Load role and task messages via PromptLoader
-    from pathlib import Path
-    from utils.prompt_loader import PromptLoader
+    Role and task messages come from the session's pinned content snapshot
+    (prompts/<lang>/v1/), so prompt edits apply to new sessions without a restart.
+    """
+    record_favorite_color_func = get_record_favorite_color_func()
 
     language = os.getenv("TARGET_LANGUAGE") or os.getenv("LANGUAGE") or "en"
     if language not in ("en", "es"):
         language = "en"
-    loader = PromptLoader(Path(__file__).parent / "prompts")
-    role_messages = loader.load(language, "v1", "role")
-    initial_task_messages = loader.load(language, "v1", "initial")
+    role_messages = content.prompt(language, "v1", "role")
+    initial_task_messages = content.prompt(language, "v1", "initial")
 
     return {
         "name": "initial",
@@ -67,6 +63,17 @@ def create_initial_node() -> NodeConfig:
 async def run_example(transport: BaseTransport, _: argparse.Namespace, handle_sigint: bool):
     # Allow GOOGLE_API_KEY to come from GEMINI_API_KEY for convenience
     cfg = load_config()
+    content_store.start_watching(cfg.content_reload_interval)
+    session_id = uuid.uuid4().hex
+    content = content_store.acquire(session_id)
+    logger.info(f"Session {session_id} using content {content.version}")
+    try:
+        await _run_session(transport, cfg, content, handle_sigint)
+    finally:
+        content_store.release(session_id)
+
+
+async def _run_session(transport: BaseTransport, cfg: AppConfig, content: ContentSnapshot, handle_sigint: bool):
     stt = CartesiaSTTService(api_key=cfg.cartesia_api_key)
     tts = CartesiaTTSService(
         api_key=cfg.cartesia_api_key,
@@ -102,7 +109,7 @@ async def run_example(transport: BaseTransport, _: argparse.Namespace, handle_si
     @transport.event_handler("on_client_connected")
     async def on_client_connected(transport, client):
         logger.info(f"Client connected")
-        await flow_manager.initialize(create_initial_node())
+        await flow_manager.initialize(create_initial_node(content))
 
     runner = PipelineRunner(handle_sigint=handle_sigint)
     await runner.run(task)
@@ -145,7 +152,7 @@ if __name__ == "__main__":
                 context_aggregator=context_aggregator,
                 transport=transport,  # type: ignore[arg-type]
             )
-            await flow_manager.initialize(create_initial_node())
+            await flow_manager.initialize(create_initial_node(content_store.current()))
             logger.info("Dry-run: Flow initialized successfully")
 
         asyncio.run(_dry_run())
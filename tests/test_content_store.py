@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from utils.content_store import EMPTY_SNAPSHOT, ContentStore
+
+ROLE = [{"role": "system", "content": "You are a tutor."}]
+FLOW = {"initial_node": "greeting", "nodes": {"greeting": {"task_messages": []}}}
+
+
+def _write(path: Path, data) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    text = data if isinstance(data, str) else json.dumps(data)
+    path.write_text(text, encoding="utf-8")
+    # Force a distinct mtime even on filesystems with coarse timestamps
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def dirs(tmp_path: Path):
+    prompts, flows = tmp_path / "prompts", tmp_path / "flows"
+    _write(prompts / "en" / "v1" / "role.json", ROLE)
+    _write(prompts / "es" / "v1" / "role.json", ROLE)
+    _write(flows / "lesson.json", FLOW)
+    return prompts, flows
+
+
+def test_loads_prompts_and_flows(dirs):
+    store = ContentStore(*dirs)
+    snapshot = store.current()
+    assert snapshot.prompt("en", "v1", "role") == ROLE
+    assert snapshot.flow("lesson") == FLOW
+    with pytest.raises(KeyError):
+        snapshot.flow("missing")
+
+
+def test_version_is_content_hash(dirs):
+    a = ContentStore(*dirs).current()
+    b = ContentStore(*dirs).current()
+    assert a.version == b.version
+
+
+def test_reload_swaps_snapshot_and_pinned_sessions_keep_theirs(dirs):
+    prompts, flows = dirs
+    store = ContentStore(prompts, flows)
+    old = store.acquire("s1")
+    assert store.reload_if_changed() is False
+
+    _write(flows / "lesson.json", {**FLOW, "initial_node": "other"})
+    assert store.reload_if_changed() is True
+    new = store.acquire("s2")
+
+    assert new is store.current()
+    assert new.version != old.version
+    assert old.flow("lesson")["initial_node"] == "greeting"
+    assert new.flow("lesson")["initial_node"] == "other"
+    assert store.session_versions() == {"s1": old.version, "s2": new.version}
+
+    store.release("s1")
+    assert store.session_versions() == {"s2": new.version}
+
+
+def test_snapshot_returns_copies(dirs):
+    snapshot = ContentStore(*dirs).current()
+    snapshot.flow("lesson")["initial_node"] = "mutated"
+    snapshot.prompt("en", "v1", "role").clear()
+    assert snapshot.flow("lesson") == FLOW
+    assert snapshot.prompt("en", "v1", "role") == ROLE
+
+
+def test_broken_file_keeps_previous_entry_and_other_edits_apply(dirs):
+    prompts, flows = dirs
+    store = ContentStore(prompts, flows)
+    store.current()
+
+    _write(prompts / "es" / "v1" / "role.json", "{broken")
+    _write(flows / "lesson.json", {**FLOW, "initial_node": "other"})
+    assert store.reload_if_changed() is True
+
+    snapshot = store.current()
+    assert snapshot.prompt("es", "v1", "role") == ROLE
+    assert snapshot.flow("lesson")["initial_node"] == "other"
+
+
+def test_broken_file_version_matches_across_workers(dirs):
+    prompts, flows = dirs
+    running = ContentStore(prompts, flows)
+    running.current()
+
+    _write(prompts / "es" / "v1" / "role.json", "{broken")
+    running.reload_if_changed()
+    fresh = ContentStore(prompts, flows)
+
+    assert running.current().prompt("es", "v1", "role") == ROLE
+    assert "es" not in {key[0] for key in fresh.current().prompts}
+    assert running.current().version == fresh.current().version
+
+    _write(prompts / "es" / "v1" / "role.json", ROLE)
+    running.reload_if_changed()
+    assert running.current().version == ContentStore(prompts, flows).current().version
+
+
+def test_unchanged_broken_file_is_not_retried(dirs, monkeypatch):
+    prompts, flows = dirs
+    store = ContentStore(prompts, flows)
+    store.current()
+    _write(prompts / "es" / "v1" / "role.json", "{broken")
+    store.reload_if_changed()
+
+    calls = []
+    monkeypatch.setattr(store, "_reload", lambda: calls.append(1))
+    assert store.reload_if_changed() is False
+    assert calls == []
+
+
+def test_broken_file_on_first_load_does_not_raise(dirs):
+    prompts, flows = dirs
+    _write(prompts / "es" / "v1" / "role.json", "{broken")
+    _write(flows / "lesson.json", "[]")
+
+    snapshot = ContentStore(prompts, flows).acquire("s1")
+    assert snapshot.prompt("en", "v1", "role") == ROLE
+    assert snapshot.flows == {}
+
+
+def test_unreadable_content_serves_empty_snapshot(dirs, monkeypatch):
+    store = ContentStore(*dirs)
+
+    def fail():
+        raise OSError("disk gone")
+
+    monkeypatch.setattr(store, "_reload", fail)
+    assert store.acquire("s1") is EMPTY_SNAPSHOT
+    assert store.session_versions() == {"s1": EMPTY_SNAPSHOT.version}
+
+
+def test_watcher_picks_up_changes_and_survives_errors(dirs, monkeypatch):
+    prompts, flows = dirs
+    store = ContentStore(prompts, flows)
+    first = store.current()
+
+    async def run():
+        real = store.reload_if_changed
+        polls = []
+
+        def flaky():
+            polls.append(1)
+            if len(polls) == 1:
+                raise FileNotFoundError("vanished mid-scan")
+            return real()
+
+        monkeypatch.setattr(store, "reload_if_changed", flaky)
+        store.start_watching(0.01)
+        _write(flows / "new.json", FLOW)
+        for _ in range(100):
+            await asyncio.sleep(0.01)
+            if store.current() is not first:
+                break
+        await store.stop_watching()
+        return len(polls)
+
+    assert asyncio.run(run()) > 1
+    assert store.current().flow("new") == FLOW
@@ -0,0 +1,315 @@
+from __future__ import annotations
+
+import asyncio
+import copy
+import hashlib
+import json
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+from loguru import logger
+
+from utils.prompt_loader import PromptLoader
+
+PromptKey = Tuple[str, str, str]
+FileStamp = Tuple[int, int]
+Fingerprint = Tuple[Tuple[str, int, int], ...]
+
+
+@dataclass(frozen=True)
+class ContentSnapshot:
+    """Immutable view of prompts and flow configs at one point in time.
+
+    `version` is a short hash of the loaded content, so the same files give
+    the same version on every worker.
+    """
+
+    version: str
+    loaded_at: float
+    reload_seconds: float
+    prompts: Mapping[PromptKey, List[Dict[str, Any]]] = field(repr=False)
+    flows: Mapping[str, Dict[str, Any]] = field(repr=False)
+
+    def prompt(self, language: str, version: str, name: str) -> List[Dict[str, Any]]:
+        """Same lookup as `PromptLoader.load`, served from this snapshot.
+
+        Returns a copy so a session can't mutate content shared with others.
+        """
+        try:
+            return copy.deepcopy(self.prompts[(language, version, name)])
+        except KeyError:
+            raise KeyError(f"Prompt not in snapshot {self.version}: {language}/{version}/{name}") from None
+
+    def flow(self, name: str) -> Dict[str, Any]:
+        try:
+            return copy.deepcopy(self.flows[name])
+        except KeyError:
+            raise KeyError(f"Flow not in snapshot {self.version}: {name}") from None
+
+
+def _content_version(prompts: Mapping[PromptKey, Any], flows: Mapping[str, Any]) -> str:
+    """Short hash of what is on disk.
+
+    Callers pass `{"broken": <sha of file bytes>}` for files that failed to
+    parse rather than any content kept from an earlier load, so every worker
+    reading the same files reports the same version.
+    """
+    payload = json.dumps(
+        {
+            "prompts": [["/".join(key), prompts[key]] for key in sorted(prompts)],
+            "flows": [[name, flows[name]] for name in sorted(flows)],
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:12]
+
+
+EMPTY_SNAPSHOT = ContentSnapshot(
+    version=_content_version({}, {}),
+    loaded_at=0.0,
+    reload_seconds=0.0,
+    prompts=MappingProxyType({}),
+    flows=MappingProxyType({}),
+)
+
+
+def _stamps(pattern: str, base: Path) -> Dict[Path, FileStamp]:
+    stamps: Dict[Path, FileStamp] = {}
+    if not base.is_dir():
+        return stamps
+    for path in base.glob(pattern):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            # Removed or renamed between glob and stat (git checkout, atomic saves)
+            continue
+        stamps[path] = (stat.st_mtime_ns, stat.st_size)
+    return stamps
+
+
+def _load_flow(path: Path) -> Dict[str, Any]:
+    with path.open("r", encoding="utf-8") as fp:
+        data = json.load(fp)
+    if not isinstance(data, dict):
+        raise ValueError(f"Flow config must be a JSON object: {path}")
+    return data
+
+
+def _file_digest(path: Path) -> str:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return ""
+
+
+class ContentStore:
+    """Versioned, hot-reloadable store for `prompts/` and `flows/`.
+
+    New sessions `acquire()` the current snapshot and keep it for their
+    lifetime; a reload builds a complete new snapshot first and only then
+    swaps the reference. Files are loaded one by one: a file that fails to
+    parse keeps its previous content (or stays absent) and is retried only
+    once it changes again, so one broken lesson never blocks other edits.
+    The snapshot version reflects the files on disk, broken ones included,
+    not the previous content kept in their place.
+    """
+
+    PROMPT_PATTERN = "*/*/*.json"
+    FLOW_PATTERN = "*.json"
+
+    def __init__(self, prompts_dir: Path, flows_dir: Path) -> None:
+        self._prompts_dir = prompts_dir
+        self._flows_dir = flows_dir
+        self._fingerprint: Optional[Fingerprint] = None
+        self._prompt_stamps: Dict[Path, FileStamp] = {}
+        self._flow_stamps: Dict[Path, FileStamp] = {}
+        # Files that failed to parse: stamp at failure time and digest of their bytes
+        self._broken: Dict[Path, Tuple[FileStamp, str]] = {}
+        self._snapshot: Optional[ContentSnapshot] = None
+        self._sessions: Dict[str, str] = {}
+        self._watch_task: Optional[asyncio.Task] = None
+        self._lock = threading.Lock()
+
+    def current(self) -> ContentSnapshot:
+        """Return the active snapshot, loading it on first use.
+
+        Never raises: if content can't be read at all, an empty snapshot is
+        returned so callers fall back to their built-in defaults.
+        """
+        snapshot = self._snapshot
+        if snapshot is not None:
+            return snapshot
+        with self._lock:
+            if self._snapshot is None:
+                try:
+                    self._reload()
+                except Exception as e:
+                    logger.error("Initial content load failed, serving empty snapshot: {}", e)
+                    self._snapshot = EMPTY_SNAPSHOT
+            return self._snapshot
+
+    def reload(self) -> ContentSnapshot:
+        """Reload changed files and atomically publish the resulting snapshot."""
+        with self._lock:
+            return self._reload()
+
+    def _reload(self) -> ContentSnapshot:
+        start = time.perf_counter()
+        previous = self._snapshot or EMPTY_SNAPSHOT
+        prompt_stamps = _stamps(self.PROMPT_PATTERN, self._prompts_dir)
+        flow_stamps = _stamps(self.FLOW_PATTERN, self._flows_dir)
+
+        loader = PromptLoader(self._prompts_dir)
+        broken: Dict[Path, Tuple[FileStamp, str]] = {}
+        prompts, versioned_prompts = self._load_entries(
+            "prompt",
+            prompt_stamps,
+            self._prompt_stamps,
+            previous.prompts,
+            lambda path: (path.parent.parent.name, path.parent.name, path.stem),
+            lambda path: loader.load(path.parent.parent.name, path.parent.name, path.stem),
+            broken,
+        )
+        flows, versioned_flows = self._load_entries(
+            "flow",
+            flow_stamps,
+            self._flow_stamps,
+            previous.flows,
+            lambda path: path.stem,
+            _load_flow,
+            broken,
+        )
+
+        self._prompt_stamps = prompt_stamps
+        self._flow_stamps = flow_stamps
+        self._broken = broken
+        self._fingerprint = self._fingerprint_of(prompt_stamps, flow_stamps)
+
+        version = _content_version(versioned_prompts, versioned_flows)
+        if self._snapshot is not None and version == self._snapshot.version:
+            return self._snapshot
+
+        snapshot = ContentSnapshot(
+            version=version,
+            loaded_at=time.time(),
+            reload_seconds=time.perf_counter() - start,
+            prompts=MappingProxyType(prompts),
+            flows=MappingProxyType(flows),
+        )
+        self._snapshot = snapshot
+        logger.info(
+            "Content snapshot {} loaded in {:.1f} ms ({} prompts, {} flows)",
+            snapshot.version,
+            snapshot.reload_seconds * 1000,
+            len(prompts),
+            len(flows),
+        )
+        return snapshot
+
+    def _load_entries(
+        self,
+        kind: str,
+        stamps: Dict[Path, FileStamp],
+        old_stamps: Dict[Path, FileStamp],
+        previous: Mapping[Any, Any],
+        key_of: Callable[[Path], Any],
+        load: Callable[[Path], Any],
+        broken: Dict[Path, Tuple[FileStamp, str]],
+    ) -> Tuple[Dict[Any, Any], Dict[Any, Any]]:
+        """Load one kind of file, reusing unchanged entries.
+
+        Returns (served entries, entries used for the version hash).
+        """
+        entries: Dict[Any, Any] = {}
+        versioned: Dict[Any, Any] = {}
+        for path, stamp in sorted(stamps.items()):
+            key = key_of(path)
+            failed = self._broken.get(path)
+            if failed is not None and failed[0] == stamp:
+                # Still the same broken file; don't retry or log again
+                broken[path] = failed
+                versioned[key] = {"broken": failed[1]}
+                if key in previous:
+                    entries[key] = previous[key]
+                continue
+            if failed is None and old_stamps.get(path) == stamp and key in previous:
+                entries[key] = versioned[key] = previous[key]
+                continue
+            try:
+                entries[key] = versioned[key] = load(path)
+            except Exception as e:
+                logger.error("Skipping {} {}: {}", kind, path, e)
+                broken[path] = (stamp, _file_digest(path))
+                versioned[key] = {"broken": broken[path][1]}
+                if key in previous:
+                    entries[key] = previous[key]
+        return entries, versioned
+
+    @staticmethod
+    def _fingerprint_of(*stamp_maps: Dict[Path, FileStamp]) -> Fingerprint:
+        return tuple(sorted((str(path), *stamp) for stamps in stamp_maps for path, stamp in stamps.items()))
+
+    def reload_if_changed(self) -> bool:
+        """Reload when any JSON file under the watched dirs changed.
+
+        Returns True if a new snapshot was published.
+        """
+        try:
+            fingerprint = self._fingerprint_of(
+                _stamps(self.PROMPT_PATTERN, self._prompts_dir),
+                _stamps(self.FLOW_PATTERN, self._flows_dir),
+            )
+            with self._lock:
+                if self._snapshot is not None and fingerprint == self._fingerprint:
+                    return False
+                previous = self._snapshot
+                return self._reload() is not previous
+        except Exception as e:
+            logger.error("Content reload failed, keeping current snapshot: {}", e)
+            return False
+
+    def start_watching(self, interval: float = 2.0) -> None:
+        """Poll for changes on the running event loop. Safe to call repeatedly."""
+        if self._watch_task is not None and not self._watch_task.done():
+            return
+        self._watch_task = asyncio.get_running_loop().create_task(self._watch(interval))
+
+    async def stop_watching(self) -> None:
+        if self._watch_task is None:
+            return
+        self._watch_task.cancel()
+        try:
+            await self._watch_task
+        except asyncio.CancelledError:
+            pass
+        self._watch_task = None
+
+    async def _watch(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                # Stat calls are cheap, but keep them off the audio event loop
+                await asyncio.to_thread(self.reload_if_changed)
+            except Exception as e:
+                logger.error("Content watcher poll failed: {}", e)
+
+    def acquire(self, session_id: str) -> ContentSnapshot:
+        """Pin the current snapshot to a session. `session_id` must be unique."""
+        snapshot = self.current()
+        with self._lock:
+            self._sessions[session_id] = snapshot.version
+        return snapshot
+
+    def release(self, session_id: str) -> None:
+        with self._lock:
+            self._sessions.pop(session_id, None)
+
+    def session_versions(self) -> Dict[str, str]:
+        """Active snapshot version per running session."""
+        with self._lock:
+            return dict(self._sessions)